@@ -5,9 +5,22 @@ Provides a base class for executing commands and parsing responses.
 """
 
 import os
+import re
+import sys
+import atexit
 import argparse
+import functools
+import importlib.util
 import logging
-from typing import List, Dict, Any, Optional
+import mmap
+import select
+import socket
+import subprocess
+import threading
+import time
+import uuid
+from collections import defaultdict, deque
+from typing import List, Dict, Any, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from abc import ABC, abstractmethod
 
@@ -17,16 +30,74 @@ import warnings
 warnings.filterwarnings(action="ignore", module=".*paramiko.*")
 import paramiko
 
+# Supported values for execute_on_hosts(transport=...) and --transport
+TRANSPORTS = ("paramiko", "asyncssh", "mux", "libssh2")
+
+# With transport "auto", host lists larger than this use asyncssh (if
+# installed) instead of one thread per concurrent host
+ASYNC_HOST_THRESHOLD = 32
+
+# Seconds between transport keepalives, keeps idle connections through NAT/firewalls
+KEEPALIVE_INTERVAL = 30
+
+SSH_CONFIG_PATH = os.path.expanduser("~/.ssh/config")
+
+# Concurrent channels per connection for unbatched executors, kept below
+# OpenSSH's default MaxSessions (10)
+MAX_CHANNELS_PER_HOST = 8
+
+
+def load_ssh_config(path: str = SSH_CONFIG_PATH) -> paramiko.SSHConfig:
+    """Return the parsed SSH config, re-parsing only when the file's mtime changes."""
+    try:
+        mtime = os.stat(path).st_mtime
+    except FileNotFoundError:
+        mtime = None  # No SSH config file
+    return _parse_ssh_config(path, mtime)
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_ssh_config(path: str, mtime: Optional[float]) -> paramiko.SSHConfig:
+    """Parse an SSH config file (cached per path and mtime)."""
+    ssh_config = paramiko.SSHConfig()
+    if mtime is not None:
+        with open(path) as f:
+            ssh_config.parse(f)
+    return ssh_config
+
+
+@functools.lru_cache(maxsize=4096)
+def lookup_ssh_config(ssh_config: paramiko.SSHConfig, host: str) -> Dict[str, Any]:
+    """Return ssh_config.lookup(host), memoized per config object and host.
+
+    A reloaded config is a new object, so stale results are never returned.
+    The returned dict is shared between callers and must not be modified.
+    """
+    return ssh_config.lookup(host)
+
+
+@functools.lru_cache(maxsize=8192)
+def resolve_host(hostname: str) -> str:
+    """Resolve a hostname to an IP address once per process.
+
+    Failed lookups raise and are not cached, so they are retried next time.
+    """
+    return socket.getaddrinfo(hostname, 22, type=socket.SOCK_STREAM)[0][4][0]
+
 
 class SSHConnection:
     """Manages persistent SSH connection to a remote host."""
 
+    # Whether execute_command() may be called from several threads at once
+    concurrent_commands: bool = True
+
     def __init__(
         self,
         host: str,
         username: Optional[str] = None,
         identity_file: Optional[str] = None,
         debug: bool = False,
+        compress: bool = False,
     ):
         """Initialize SSH connection to remote host.
 
@@ -35,21 +106,18 @@ class SSHConnection:
             username: SSH username (overrides user in host string)
             identity_file: Path to SSH key file
             debug: Enable debug logging
+            compress: Enable SSH transport compression
         """
         self.host = host  # Original hostname
         self.username = username
         self.identity_file = identity_file
         self.debug = debug
+        self.compress = compress
         self.ssh = paramiko.SSHClient()
         self.ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
-        # Load SSH config
-        self.ssh_config = paramiko.SSHConfig()
-        try:
-            with open(os.path.expanduser("~/.ssh/config")) as f:
-                self.ssh_config.parse(f)
-        except FileNotFoundError:
-            pass  # No SSH config file
+        # Load SSH config (parsed once per process)
+        self.ssh_config = load_ssh_config()
 
         self.connected = False
 
@@ -65,11 +133,12 @@ class SSHConnection:
             self.logger = logging.getLogger(f"SSHConnection-{host}")
             self.logger.setLevel(logging.WARNING)
 
-    def connect(self) -> None:
-        """Establish SSH connection."""
-        if self.debug:
-            self.logger.debug(f"Starting SSH connection to {self.host}")
+    def _resolve_target(self) -> str:
+        """Fill in username/identity file from user@host and ~/.ssh/config.
 
+        Returns:
+            The hostname to connect to
+        """
         # Parse username from host if in user@host format
         connect_host = self.host
         if "@" in self.host:
@@ -79,7 +148,7 @@ class SSHConnection:
             connect_host = parts[1]
 
         # Apply SSH config for this host
-        host_config = self.ssh_config.lookup(connect_host)
+        host_config = lookup_ssh_config(self.ssh_config, connect_host)
 
         # Get hostname from config (may be different from connect_host)
         hostname = host_config.get("hostname", connect_host)
@@ -102,16 +171,30 @@ class SSHConnection:
                 f"Username: {self.username}, Hostname: {hostname}, Identity: {self.identity_file}"
             )
 
-        # Configure connection parameters
+        return hostname
+
+    def connect(self) -> None:
+        """Establish SSH connection."""
+        if self.debug:
+            self.logger.debug(f"Starting SSH connection to {self.host}")
+
+        hostname = self._resolve_target()
+
+        # Configure connection parameters (DNS resolved once, name kept for logs)
         connect_kwargs = {
-            "hostname": hostname,
+            "hostname": resolve_host(hostname),
             "username": self.username,
             "timeout": 10,
+            "banner_timeout": 10,
+            "auth_timeout": 10,
+            "compress": self.compress,
         }
 
-        # Add identity file if specified
+        # Add identity file if specified, skipping agent and default key probing
         if self.identity_file:
             connect_kwargs["key_filename"] = self.identity_file
+            connect_kwargs["allow_agent"] = False
+            connect_kwargs["look_for_keys"] = False
             if self.debug:
                 self.logger.debug(f"Using identity file: {self.identity_file}")
 
@@ -120,6 +203,7 @@ class SSHConnection:
 
         # Connect to remote host
         self.ssh.connect(**connect_kwargs)
+        self.ssh.get_transport().set_keepalive(KEEPALIVE_INTERVAL)
         self.connected = True
 
         if self.debug:
@@ -135,6 +219,21 @@ class SSHConnection:
         Returns:
             Tuple of (stdout, stderr, exit_code)
         """
+        stdout, stderr, exit_code = self.execute_command_bytes(command, timeout)
+        return stdout.decode("utf-8"), stderr.decode("utf-8"), exit_code
+
+    def execute_command_bytes(
+        self, command: str, timeout: int = 30
+    ) -> tuple[bytes, bytes, int]:
+        """Execute a command and return its raw stdout, stderr, and exit code.
+
+        Args:
+            command: The command to execute
+            timeout: Command timeout in seconds
+
+        Returns:
+            Tuple of (stdout, stderr, exit_code) with undecoded output
+        """
         if not self.connected:
             raise RuntimeError("Not connected to host")
 
@@ -142,26 +241,64 @@ class SSHConnection:
             if self.debug:
                 self.logger.debug(f"Executing command: {command}")
 
-            stdin, stdout, stderr = self.ssh.exec_command(command, timeout=timeout)
-
-            # Wait for command to complete and read output
-            exit_code = stdout.channel.recv_exit_status()
-            stdout_text = stdout.read().decode("utf-8")
-            stderr_text = stderr.read().decode("utf-8")
+            channel = self.ssh.get_transport().open_session(timeout=timeout)
+            try:
+                channel.settimeout(timeout)
+                channel.exec_command(command)
+                stdout_bytes, stderr_bytes = self._drain(channel, timeout)
+                exit_code = channel.recv_exit_status()
+            finally:
+                channel.close()
 
             if self.debug:
                 self.logger.debug(
                     f"Command completed with exit code {exit_code}, "
-                    f"stdout: {len(stdout_text)} bytes, stderr: {len(stderr_text)} bytes"
+                    f"stdout: {len(stdout_bytes)} bytes, stderr: {len(stderr_bytes)} bytes"
                 )
 
-            return stdout_text, stderr_text, exit_code
+            return stdout_bytes, stderr_bytes, exit_code
 
         except Exception as e:
             if self.debug:
                 self.logger.error(f"Error executing command: {e}")
             raise
 
+    @staticmethod
+    def _drain(channel: paramiko.Channel, timeout: float) -> tuple[bytes, bytes]:
+        """Read stdout and stderr from a channel until EOF.
+
+        Both streams are drained as data arrives, so a remote command that
+        fills the channel window is never left blocked waiting for us.
+        """
+        stdout_buf = bytearray()
+        stderr_buf = bytearray()
+        deadline = time.monotonic() + timeout
+
+        while True:
+            while channel.recv_ready():
+                stdout_buf += channel.recv(65536)
+            while channel.recv_stderr_ready():
+                stderr_buf += channel.recv_stderr(65536)
+
+            # Only EOF (or the channel closing) ends the output: the server may
+            # send the exit status before the last of the data
+            if channel.eof_received or channel.closed:
+                if not channel.recv_ready() and not channel.recv_stderr_ready():
+                    return bytes(stdout_buf), bytes(stderr_buf)
+                continue
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Command timed out after {timeout}s")
+            select.select([channel], [], [], remaining)
+
+    def is_active(self) -> bool:
+        """Check whether the underlying SSH transport is still usable."""
+        if not self.connected:
+            return False
+        transport = self.ssh.get_transport()
+        return transport is not None and transport.is_active()
+
     def close(self) -> None:
         """Close SSH connection."""
         if self.ssh:
@@ -171,15 +308,440 @@ class SSHConnection:
             self.logger.debug("SSH connection closed")
 
 
+class SSHConnectionLibssh2(SSHConnection):
+    """SSH connection backed by libssh2 (ssh2-python) instead of paramiko.
+
+    Key exchange, ciphers and channel handling run in C. Host resolution via
+    ~/.ssh/config is shared with SSHConnection. Requires the ssh2-python
+    package.
+    """
+
+    # A non-blocking libssh2 session must only be driven by one thread
+    concurrent_commands = False
+
+    def connect(self) -> None:
+        """Establish SSH connection."""
+        from ssh2.session import Session, LIBSSH2_FLAG_COMPRESS
+
+        if self.debug:
+            self.logger.debug(f"Starting libssh2 connection to {self.host}")
+
+        hostname = self._resolve_target()
+
+        self.sock = socket.create_connection((resolve_host(hostname), 22), timeout=10)
+        self.session = Session()
+        if self.compress:
+            self.session.flag(LIBSSH2_FLAG_COMPRESS)
+        self.session.set_timeout(10_000)
+        self.session.handshake(self.sock)
+
+        if self.identity_file:
+            self.session.userauth_publickey_fromfile(
+                self.username, self.identity_file
+            )
+            if self.debug:
+                self.logger.debug(f"Using identity file: {self.identity_file}")
+        else:
+            self.session.agent_auth(self.username)
+
+        # Only sets the interval: libssh2 sends a keepalive when
+        # keepalive_send() is called and the interval has passed
+        self.session.keepalive_config(False, KEEPALIVE_INTERVAL)
+        # Non-blocking from here on so stdout and stderr can be read in turn
+        self.session.set_blocking(False)
+        self.connected = True
+
+        if self.debug:
+            self.logger.debug("libssh2 connection established successfully")
+
+    def _wait_socket(self, deadline: float) -> None:
+        """Wait until the session can make progress or the deadline passes."""
+        from ssh2.session import (
+            LIBSSH2_SESSION_BLOCK_INBOUND,
+            LIBSSH2_SESSION_BLOCK_OUTBOUND,
+        )
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("Command timed out")
+        directions = self.session.block_directions()
+        readers = [self.sock] if directions & LIBSSH2_SESSION_BLOCK_INBOUND else []
+        writers = [self.sock] if directions & LIBSSH2_SESSION_BLOCK_OUTBOUND else []
+        select.select(readers, writers, [], remaining)
+
+    def _call(self, func, deadline: float, *args):
+        """Call a non-blocking libssh2 function, retrying while it returns EAGAIN."""
+        from ssh2.error_codes import LIBSSH2_ERROR_EAGAIN
+
+        while True:
+            result = func(*args)
+            code = result[0] if isinstance(result, tuple) else result
+            if code != LIBSSH2_ERROR_EAGAIN:
+                return result
+            self._wait_socket(deadline)
+
+    def execute_command_bytes(
+        self, command: str, timeout: int = 30
+    ) -> tuple[bytes, bytes, int]:
+        """Execute a command and return its raw stdout, stderr, and exit code.
+
+        Args:
+            command: The command to execute
+            timeout: Command timeout in seconds
+
+        Returns:
+            Tuple of (stdout, stderr, exit_code) with undecoded output
+        """
+        from ssh2.error_codes import LIBSSH2_ERROR_EAGAIN
+
+        if not self.connected:
+            raise RuntimeError("Not connected to host")
+
+        if self.debug:
+            self.logger.debug(f"Executing command: {command}")
+
+        deadline = time.monotonic() + timeout
+        self.session.keepalive_send()
+        channel = self._call(self.session.open_session, deadline)
+        self._call(channel.execute, deadline, command)
+
+        stdout_buf = bytearray()
+        stderr_buf = bytearray()
+        # (read function, buffer) for each stream not yet at EOF
+        pending = [(channel.read, stdout_buf), (channel.read_stderr, stderr_buf)]
+        while pending:
+            if time.monotonic() >= deadline:
+                raise TimeoutError("Command timed out")
+            received = False
+            for stream in list(pending):
+                read, buf = stream
+                size, data = read(65536)
+                if size > 0:
+                    buf += data
+                    received = True
+                elif size == 0:
+                    pending.remove(stream)
+                elif size != LIBSSH2_ERROR_EAGAIN:
+                    raise RuntimeError(f"libssh2 channel read failed (error {size})")
+            # Only wait when neither stream had data, whichever one is done
+            if pending and not received:
+                self._wait_socket(deadline)
+
+        self._call(channel.close, deadline)
+        self._call(channel.wait_closed, deadline)
+        exit_code = channel.get_exit_status()
+
+        if self.debug:
+            self.logger.debug(
+                f"Command completed with exit code {exit_code}, "
+                f"stdout: {len(stdout_buf)} bytes, stderr: {len(stderr_buf)} bytes"
+            )
+
+        return bytes(stdout_buf), bytes(stderr_buf), exit_code
+
+    def is_active(self) -> bool:
+        """Check whether the libssh2 session is still usable.
+
+        Also sends the keepalive when KEEPALIVE_INTERVAL has passed, so a
+        connection idling in the pool is kept open through NAT/firewalls.
+        The pool calls this on every borrow and release.
+        """
+        if not self.connected or self.sock.fileno() == -1:
+            return False
+        try:
+            self.session.keepalive_send()
+        except Exception:
+            return False
+        return True
+
+    def close(self) -> None:
+        """Close SSH connection."""
+        if self.connected:
+            try:
+                self.session.set_blocking(True)
+                self.session.disconnect()
+            except Exception:
+                pass
+            self.sock.close()
+        self.connected = False
+        if self.debug:
+            self.logger.debug("libssh2 connection closed")
+
+
+class MultiplexedSSHConnection:
+    """SSH connection through an OpenSSH ControlMaster socket.
+
+    Same API as SSHConnection, but shells out to the ssh binary. The first
+    connect pays the handshake; every command afterwards reuses the master
+    socket, so ~/.ssh/config, agents and ProxyJump behave exactly like ssh.
+    """
+
+    # Each command is its own ssh process on the shared master socket
+    concurrent_commands: bool = True
+
+    def __init__(
+        self,
+        host: str,
+        username: Optional[str] = None,
+        identity_file: Optional[str] = None,
+        debug: bool = False,
+        compress: bool = False,
+    ):
+        """Initialize multiplexed SSH connection to remote host.
+
+        Args:
+            host: Hostname (user@host format supported)
+            username: SSH username (overrides user in host string)
+            identity_file: Path to SSH key file
+            debug: Enable debug logging
+            compress: Enable SSH compression
+        """
+        self.host = host
+        self.username = username
+        self.identity_file = identity_file
+        self.debug = debug
+        self.compress = compress
+        self.sock = f"/tmp/cli-mux-{uuid.uuid4().hex}"
+        self.connected = False
+        # Set when a command failed the way a dead master would make it fail,
+        # so that is_active() asks the master instead of trusting the socket
+        self._check_master = False
+        self.logger = logging.getLogger(f"MultiplexedSSHConnection-{host}")
+        if not self.debug:
+            self.logger.setLevel(logging.WARNING)
+
+    def _ssh_args(self) -> List[str]:
+        """Return the ssh argv prefix that targets the control socket."""
+        args = ["ssh", "-S", self.sock]
+        if self.username:
+            args += ["-l", self.username]
+        return args
+
+    def connect(self) -> None:
+        """Start the ControlMaster process for this host."""
+        if self.debug:
+            self.logger.debug(f"Starting SSH control master for {self.host}")
+
+        args = [
+            "ssh",
+            "-M",
+            "-N",
+            "-f",
+            "-o",
+            f"ControlPath={self.sock}",
+            "-o",
+            "ControlPersist=60s",
+            "-o",
+            "BatchMode=yes",
+            "-o",
+            "ConnectTimeout=10",
+            "-o",
+            "ServerAliveInterval=" + str(KEEPALIVE_INTERVAL),
+            "-o",
+            "StrictHostKeyChecking=accept-new",
+        ]
+        if self.username:
+            args += ["-l", self.username]
+        if self.identity_file:
+            args += ["-i", self.identity_file, "-o", "IdentitiesOnly=yes"]
+        if self.compress:
+            args.append("-C")
+        args.append(self.host)
+
+        result = subprocess.run(args, capture_output=True, text=True, timeout=30)
+        if result.returncode != 0:
+            raise RuntimeError(
+                result.stderr.strip() or f"ssh exited with code {result.returncode}"
+            )
+        self.connected = True
+
+        if self.debug:
+            self.logger.debug(f"Control master listening on {self.sock}")
+
+    def execute_command(self, command: str, timeout: int = 30) -> tuple[str, str, int]:
+        """Execute a command over the control socket.
+
+        Args:
+            command: The command to execute
+            timeout: Command timeout in seconds
+
+        Returns:
+            Tuple of (stdout, stderr, exit_code)
+        """
+        stdout, stderr, exit_code = self.execute_command_bytes(command, timeout)
+        return stdout.decode("utf-8"), stderr.decode("utf-8"), exit_code
+
+    def execute_command_bytes(
+        self, command: str, timeout: int = 30
+    ) -> tuple[bytes, bytes, int]:
+        """Execute a command over the control socket, returning raw output.
+
+        Args:
+            command: The command to execute
+            timeout: Command timeout in seconds
+
+        Returns:
+            Tuple of (stdout, stderr, exit_code) with undecoded output
+        """
+        if not self.connected:
+            raise RuntimeError("Not connected to host")
+
+        if self.debug:
+            self.logger.debug(f"Executing command: {command}")
+
+        # Stays set if the command times out; cleared unless ssh itself failed
+        self._check_master = True
+        result = subprocess.run(
+            self._ssh_args() + [self.host, command],
+            capture_output=True,
+            timeout=timeout,
+        )
+        self._check_master = result.returncode == 255
+        return result.stdout, result.stderr, result.returncode
+
+    def is_active(self) -> bool:
+        """Check whether the control master is still running.
+
+        The pool calls this on every borrow and release, so it only looks for
+        the control socket; ``ssh -O check`` is run after a command that timed
+        out or exited with ssh's own error code 255.
+        """
+        if not self.connected or not os.path.exists(self.sock):
+            return False
+        if self._check_master:
+            result = subprocess.run(
+                self._ssh_args() + ["-O", "check", self.host], capture_output=True
+            )
+            if result.returncode != 0:
+                return False
+            self._check_master = False
+        return True
+
+    def close(self) -> None:
+        """Stop the control master."""
+        if self.connected:
+            subprocess.run(
+                self._ssh_args() + ["-O", "exit", self.host], capture_output=True
+            )
+        self.connected = False
+        if self.debug:
+            self.logger.debug("SSH control master closed")
+
+
+PoolKey = Tuple[str, Optional[str], Optional[str]]
+
+# Prefix of the markers printed after each command when several commands
+# share one exec; each batch adds a random token, so command output that
+# happens to contain the prefix cannot be taken for a marker
+CMD_SEP = "__CMD_SEP__"
+
+
+class SSHConnectionPool:
+    """Keeps idle SSH connections around for reuse, keyed by (host, username, identity_file)."""
+
+    def __init__(self, max_per_key: int = 4, connection_class: type = SSHConnection):
+        """Initialize the connection pool.
+
+        Args:
+            max_per_key: Maximum number of open connections per key (per host)
+            connection_class: SSHConnection or MultiplexedSSHConnection
+        """
+        self.max_per_key = max_per_key
+        self.connection_class = connection_class
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._idle: Dict[PoolKey, deque] = defaultdict(deque)
+        self._open: Dict[PoolKey, int] = defaultdict(int)
+
+    def borrow(
+        self, key: PoolKey, debug: bool = False, compress: bool = False
+    ):
+        """Return a connected connection for key, reusing an idle one when possible.
+
+        Blocks while max_per_key connections for this key are already in use.
+        The debug and compress options only apply to newly created connections.
+        """
+        with self._available:
+            while True:
+                idle = self._idle[key]
+                while idle:
+                    connection = idle.pop()
+                    if connection.is_active():
+                        return connection
+                    connection.close()
+                    self._open[key] -= 1
+                if self._open[key] < self.max_per_key:
+                    self._open[key] += 1
+                    break
+                self._available.wait()
+
+        host, username, identity_file = key
+        connection = self.connection_class(
+            host, username, identity_file, debug, compress
+        )
+        try:
+            connection.connect()
+        except Exception:
+            connection.close()
+            self._discard(key)
+            raise
+        return connection
+
+    def release(self, key: PoolKey, connection: Any) -> None:
+        """Return a connection to the pool, closing it if the transport is no longer active."""
+        if not connection.is_active():
+            connection.close()
+            self._discard(key)
+            return
+        with self._available:
+            self._idle[key].append(connection)
+            self._available.notify()
+
+    def close_all(self) -> None:
+        """Close every idle connection held by the pool."""
+        with self._available:
+            for key, idle in self._idle.items():
+                while idle:
+                    idle.pop().close()
+                    self._open[key] -= 1
+            self._available.notify_all()
+
+    def _discard(self, key: PoolKey) -> None:
+        """Forget a connection that was closed instead of returned."""
+        with self._available:
+            self._open[key] -= 1
+            self._available.notify()
+
+
+# Shared pools used by CommandExecutor instances in this process
+POOL = SSHConnectionPool()
+MUX_POOL = SSHConnectionPool(connection_class=MultiplexedSSHConnection)
+LIBSSH2_POOL = SSHConnectionPool(connection_class=SSHConnectionLibssh2)
+POOLS = {"paramiko": POOL, "mux": MUX_POOL, "libssh2": LIBSSH2_POOL}
+for _pool in POOLS.values():
+    atexit.register(_pool.close_all)
+
+
 class CommandExecutor(ABC):
     """Abstract base class for executing commands on remote hosts and parsing responses."""
 
+    # Run all commands in one exec; set to False when commands must stay isolated
+    batched: bool = True
+
+    # Enable SSH compression for executors with large, repetitive text output
+    compress: bool = False
+
+    # Pass stdout/stderr to parse_response() as str; set to False to get raw
+    # bytes when the parser does not need text (json.loads, int(), split())
+    decode_output: bool = True
+
     def __init__(
         self,
         host: str,
         username: Optional[str] = None,
         identity_file: Optional[str] = None,
         debug: bool = False,
+        pool: Optional[SSHConnectionPool] = None,
     ):
         """Initialize the command executor.
 
@@ -188,18 +750,23 @@ class CommandExecutor(ABC):
             username: SSH username
             identity_file: Path to SSH identity file
             debug: Enable debug logging
+            pool: Connection pool to borrow from (default: POOL)
         """
         self.host = host
-        self.connection = SSHConnection(host, username, identity_file, debug)
+        self.pool_key: PoolKey = (host, username, identity_file)
+        self.pool = pool or POOL
+        self.connection = None
         self.debug = debug
 
     def connect(self) -> None:
-        """Establish SSH connection to the host."""
-        self.connection.connect()
+        """Borrow an SSH connection to the host from the connection pool."""
+        self.connection = self.pool.borrow(self.pool_key, self.debug, self.compress)
 
     def close(self) -> None:
-        """Close the SSH connection."""
-        self.connection.close()
+        """Return the SSH connection to the connection pool."""
+        if self.connection is not None:
+            self.pool.release(self.pool_key, self.connection)
+            self.connection = None
 
     @abstractmethod
     def get_commands(self) -> List[str]:
@@ -218,8 +785,8 @@ class CommandExecutor(ABC):
 
         Args:
             command: The command that was executed
-            stdout: Standard output from the command
-            stderr: Standard error from the command
+            stdout: Standard output from the command (bytes if not decode_output)
+            stderr: Standard error from the command (bytes if not decode_output)
             exit_code: Exit code from the command
 
         Returns:
@@ -238,23 +805,10 @@ class CommandExecutor(ABC):
         try:
             self.connect()
 
-            for command in self.get_commands():
-                try:
-                    stdout, stderr, exit_code = self.connection.execute_command(command)
-                    parsed = self.parse_response(command, stdout, stderr, exit_code)
-                    results["commands"][command] = {
-                        "exit_code": exit_code,
-                        "parsed_data": parsed,
-                        "success": exit_code == 0,
-                    }
-                except Exception as e:
-                    results["commands"][command] = {
-                        "exit_code": -1,
-                        "error": str(e),
-                        "success": False,
-                    }
-                    if self.debug:
-                        print(f"Error executing '{command}' on {self.host}: {e}")
+            if self.batched:
+                results["commands"] = self.execute_batched()
+            else:
+                results["commands"] = self.execute_per_command()
 
         except Exception as e:
             results["success"] = False
@@ -266,6 +820,131 @@ class CommandExecutor(ABC):
 
         return results
 
+    def execute_per_command(self) -> Dict[str, Dict[str, Any]]:
+        """Execute each command on its own SSH channel.
+
+        Channels run concurrently over the one connection (up to
+        MAX_CHANNELS_PER_HOST at a time) when the connection supports it,
+        otherwise one after another.
+
+        Returns:
+            Dictionary of per-command results keyed by command
+        """
+        commands = self.get_commands()
+        workers = min(MAX_CHANNELS_PER_HOST, len(commands))
+        if not self.connection.concurrent_commands or workers <= 1:
+            return {command: self._run_command(command) for command in commands}
+
+        with ThreadPoolExecutor(max_workers=workers) as channel_pool:
+            futures = [channel_pool.submit(self._run_command, c) for c in commands]
+            command_results = {
+                command: future.result() for command, future in zip(commands, futures)
+            }
+        return command_results
+
+    def _run_command(self, command: str) -> Dict[str, Any]:
+        """Run one command on its own channel and build its result entry."""
+        try:
+            stdout, stderr, exit_code = self.connection.execute_command_bytes(command)
+            return self.command_result(command, stdout, stderr, exit_code)
+        except Exception as e:
+            return self.command_error(command, str(e))
+
+    def execute_batched(self, timeout: int = 30) -> Dict[str, Dict[str, Any]]:
+        """Execute all commands in a single remote shell invocation.
+
+        Each command is followed by a marker carrying its exit code, so the
+        combined output can be split back into per-command stdout/stderr.
+
+        Args:
+            timeout: Per-command timeout in seconds (summed for the whole batch)
+
+        Returns:
+            Dictionary of per-command results keyed by command
+        """
+        commands = self.get_commands()
+        script, marker = self.batch_script(commands)
+        try:
+            stdout, stderr, _ = self.connection.execute_command_bytes(
+                script, timeout=timeout * len(commands)
+            )
+        except Exception as e:
+            return {
+                command: self.command_error(command, str(e)) for command in commands
+            }
+        return self.split_batch(commands, marker, stdout, stderr)
+
+    def batch_script(self, commands: List[str]) -> Tuple[str, str]:
+        """Join commands into one shell script that marks where each one ends.
+
+        collect_async runs the script on its own asyncssh connection and hands
+        the output to split_batch(), so this and the helpers below are public.
+
+        Returns:
+            The script and the marker to pass to split_batch()
+        """
+        marker = f"{CMD_SEP}{uuid.uuid4().hex}"
+        script = " ; ".join(
+            f"{{ {command}\n}}; printf '\\n{marker}%d__\\n' $?; "
+            f"printf '\\n{marker}\\n' >&2"
+            for command in commands
+        )
+        return script, marker
+
+    def split_batch(
+        self, commands: List[str], marker: str, stdout: bytes, stderr: bytes
+    ) -> Dict[str, Dict[str, Any]]:
+        """Split the output of batch_script() back into per-command results."""
+        # re.split with one capture group yields [out0, rc0, out1, rc1, ..., tail]
+        stdout_parts = re.split(rf"\n{marker}(\d+)__\n".encode(), stdout)
+        stderr_parts = re.split(rf"\n{marker}\n".encode(), stderr)
+
+        command_results = {}
+        for i, command in enumerate(commands):
+            if 2 * i + 1 >= len(stdout_parts):
+                command_results[command] = self.command_error(
+                    command, "Batch ended before command completed"
+                )
+                continue
+            command_stdout = stdout_parts[2 * i]
+            exit_code = int(stdout_parts[2 * i + 1])
+            command_stderr = stderr_parts[i] if i < len(stderr_parts) else b""
+            try:
+                command_results[command] = self.command_result(
+                    command, command_stdout, command_stderr, exit_code
+                )
+            except Exception as e:
+                command_results[command] = self.command_error(command, str(e))
+        return command_results
+
+    def command_result(
+        self, command: str, stdout: bytes, stderr: bytes, exit_code: int
+    ) -> Dict[str, Any]:
+        """Parse one command's raw output into its result entry."""
+        if self.decode_output:
+            stdout = stdout.decode("utf-8")
+            stderr = stderr.decode("utf-8")
+        parsed = self.parse_response(command, stdout, stderr, exit_code)
+        return {
+            "exit_code": exit_code,
+            "parsed_data": parsed,
+            "success": exit_code == 0,
+        }
+
+    def command_error(self, command: str, error: str) -> Dict[str, Any]:
+        """Build the result entry for a command that could not be run or parsed."""
+        if self.debug:
+            print(f"Error executing '{command}' on {self.host}: {error}")
+        return {
+            "exit_code": -1,
+            "error": error,
+            "success": False,
+        }
+
+
+# A non-comment, non-blank line with surrounding whitespace trimmed
+HOST_LINE_RE = re.compile(rb"(?m)^[ \t]*([^#\s][^\n]*?)[ \t\r]*$")
+
 
 def read_hosts_file(filepath: str) -> List[str]:
     """Read a file containing hostnames (one per line) and return list of hosts.
@@ -274,16 +953,15 @@ def read_hosts_file(filepath: str) -> List[str]:
         filepath: Path to the hosts file
 
     Returns:
-        List of hostnames (empty lines and comments starting with # are ignored)
+        List of hostnames in file order with duplicates removed
+        (empty lines and comments starting with # are ignored)
     """
-    hosts = []
-    with open(filepath, "r") as f:
-        for line in f:
-            line = line.strip()
-            # Skip empty lines and comments
-            if line and not line.startswith("#"):
-                hosts.append(line)
-    return hosts
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            hosts = [m.group(1).decode() for m in HOST_LINE_RE.finditer(buf)]
+    return list(dict.fromkeys(hosts))
 
 
 def execute_on_hosts(
@@ -294,24 +972,55 @@ def execute_on_hosts(
     max_workers: int = 5,
     debug: bool = False,
     show_progress: bool = True,
+    transport: str = "auto",
 ) -> List[Dict[str, Any]]:
     """Execute commands on multiple hosts concurrently using a task queue.
 
     Uses ThreadPoolExecutor to limit concurrent SSH connections. Hosts are
-    queued and executed as workers become available.
+    queued and executed as workers become available. With transport
+    "asyncssh" the fan-out runs on asyncio instead (see collect_async.py).
+    Transport "auto" picks asyncssh for more than ASYNC_HOST_THRESHOLD
+    hosts when it is installed, and paramiko otherwise.
 
     Args:
         executor_class: Class derived from CommandExecutor to use
         hosts: List of hostnames to connect to
         username: SSH username (optional)
         identity_file: Path to SSH identity file (optional)
-        max_workers: Maximum number of concurrent SSH connections (default: 5)
+        max_workers: Maximum number of concurrent SSH connections (default: 5);
+            the asyncssh fan-out uses collect_async.TOTAL_LIMIT and
+            CONNECT_LIMIT instead
         debug: Enable debug logging
         show_progress: Show progress messages as hosts complete
+        transport: SSH transport to use, "auto" or one of TRANSPORTS
 
     Returns:
         List of result dictionaries, one per host
     """
+    if transport == "auto":
+        use_async = (
+            len(hosts) > ASYNC_HOST_THRESHOLD
+            and importlib.util.find_spec("asyncssh") is not None
+        )
+        transport = "asyncssh" if use_async else "paramiko"
+
+    if transport == "asyncssh":
+        import asyncio
+        from collect_async import async_execute_on_hosts
+
+        return asyncio.run(
+            async_execute_on_hosts(
+                executor_class,
+                hosts,
+                username=username,
+                identity_file=identity_file,
+                debug=debug,
+                show_progress=show_progress,
+                max_channels=MAX_CHANNELS_PER_HOST,
+            )
+        )
+
+    pool = POOLS[transport]
     results = []
     completed = 0
     total = len(hosts)
@@ -320,7 +1029,7 @@ def execute_on_hosts(
         """Execute on a single host."""
         if show_progress and not debug:
             print(f"  → Starting: {host}")
-        executor = executor_class(host, username, identity_file, debug)
+        executor = executor_class(host, username, identity_file, debug, pool=pool)
         return executor.execute()
 
     # Execute concurrently on all hosts with task queue
@@ -402,7 +1111,7 @@ def main():
         "--workers",
         type=int,
         default=5,
-        help="Maximum number of concurrent SSH connections (task queue size)",
+        help="Maximum number of concurrent SSH connections (task queue size); the asyncssh transport uses its own limits",
     )
     parser.add_argument(
         "-j",
@@ -411,6 +1120,12 @@ def main():
         dest="workers",
         help="Alias for --workers (maximum concurrent jobs)",
     )
+    parser.add_argument(
+        "--transport",
+        choices=("auto",) + TRANSPORTS,
+        default="auto",
+        help=f"SSH transport (auto uses asyncssh above {ASYNC_HOST_THRESHOLD} hosts when installed, asyncssh requires the asyncssh package, mux uses the ssh binary with ControlMaster, libssh2 requires ssh2-python)",
+    )
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
     args = parser.parse_args()
@@ -434,9 +1149,8 @@ def main():
         return 1
 
     # Execute on all hosts using the example executor
-    print(
-        f"🚀 Executing commands on {len(hosts)} hosts with {args.workers} concurrent workers..."
-    )
+    # The task queue line that follows shows the concurrency of the transport
+    print(f"🚀 Executing commands on {len(hosts)} hosts...")
     results = execute_on_hosts(
         ExampleExecutor,
         hosts,
@@ -445,34 +1159,34 @@ def main():
         max_workers=args.workers,
         debug=args.debug,
         show_progress=not args.debug,
+        transport=args.transport,
     )
 
-    # Display results
-    print("\n" + "=" * 80)
-    print("RESULTS")
-    print("=" * 80)
+    # Display results, written in one go rather than a print() per line
+    lines: List[str] = ["", "=" * 80, "RESULTS", "=" * 80]
 
     for result in results:
         host = result["host"]
         success = result["success"]
 
-        print(f"\n{host}: {'SUCCESS' if success else 'FAILED'}")
+        lines.append(f"\n{host}: {'SUCCESS' if success else 'FAILED'}")
         if not success:
-            print(f"  Error: {result.get('error', 'Unknown error')}")
+            lines.append(f"  Error: {result.get('error', 'Unknown error')}")
         else:
             for cmd, cmd_result in result["commands"].items():
                 if cmd_result["success"]:
                     parsed = cmd_result["parsed_data"]
-                    print(f"  {cmd}: {parsed['output'][:100]}")
+                    lines.append(f"  {cmd}: {parsed['output'][:100]}")
                 else:
-                    print(
+                    lines.append(
                         f"  {cmd}: FAILED - {cmd_result.get('error', 'Unknown error')}"
                     )
 
     # Summary
     successful = sum(1 for r in results if r["success"])
-    print(f"\n{'='*80}")
-    print(f"Summary: {successful}/{len(results)} hosts successful")
+    lines.append(f"\n{'='*80}")
+    lines.append(f"Summary: {successful}/{len(results)} hosts successful")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return 0 if successful == len(results) else 1
 
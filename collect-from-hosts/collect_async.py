@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Asyncio-based fan-out for CommandExecutor classes using asyncssh.
+Only the transport changes: commands and parsing still come from the executor.
+"""
+
+import asyncio
+from typing import List, Dict, Any, Optional
+
+import asyncssh
+
+# Handshakes in flight at once; stays below sshd's default MaxStartups (10)
+# so bursts of new connections are not dropped as unauthenticated
+CONNECT_LIMIT = 8
+
+# Hosts in progress at once; each is one socket and a few coroutines, so this
+# can be far above a thread pool's worker count
+TOTAL_LIMIT = 256
+
+# Concurrent sessions per connection for unbatched executors, kept below
+# OpenSSH's default MaxSessions (10)
+MAX_CHANNELS = 8
+
+
+async def run_host(
+    executor: Any,
+    semaphore: asyncio.Semaphore,
+    connect_semaphore: asyncio.Semaphore,
+    timeout: int = 30,
+    max_channels: int = MAX_CHANNELS,
+) -> Dict[str, Any]:
+    """Run an executor's commands on its host over a single asyncssh connection.
+
+    Batched executors send all commands in one session, exactly as
+    CommandExecutor.execute_batched() does. Otherwise each command gets its
+    own session on the shared connection, at most max_channels at a time.
+
+    Args:
+        executor: CommandExecutor instance (provides host, commands and parsing)
+        semaphore: Limits the number of hosts in progress
+        connect_semaphore: Limits the number of handshakes in progress
+        timeout: Per-command timeout in seconds
+        max_channels: Maximum number of sessions open at once per connection
+
+    Returns:
+        Result dictionary in the same format as CommandExecutor.execute()
+    """
+    host, username, identity_file = executor.pool_key
+    results = {"host": host, "success": True, "error": None, "commands": {}}
+
+    # Parse username from host if in user@host format
+    connect_host = host
+    if "@" in host:
+        user_part, connect_host = host.split("@", 1)
+        if username is None:
+            username = user_part
+
+    connect_kwargs: Dict[str, Any] = {
+        "known_hosts": None,  # Same as paramiko.AutoAddPolicy
+        "connect_timeout": 10,
+    }
+    if executor.compress:
+        connect_kwargs["compression_algs"] = ["zlib@openssh.com", "zlib", "none"]
+    if username:
+        connect_kwargs["username"] = username
+    if identity_file:
+        connect_kwargs["client_keys"] = [identity_file]
+        connect_kwargs["agent_path"] = None
+
+    commands = executor.get_commands()
+
+    async with semaphore:
+        try:
+            async with connect_semaphore:
+                conn = await asyncssh.connect(connect_host, **connect_kwargs)
+        except Exception as e:
+            results["success"] = False
+            results["error"] = str(e)
+            if executor.debug:
+                print(f"Failed to connect to {host}: {e}")
+            return results
+
+        async with conn:
+            if executor.batched:
+                # encoding=None keeps output as bytes for the marker split
+                script, marker = executor.batch_script(commands)
+                try:
+                    proc = await conn.run(
+                        script,
+                        timeout=timeout * len(commands),
+                        encoding=None,
+                    )
+                except Exception as e:
+                    results["commands"] = {
+                        command: executor.command_error(command, str(e))
+                        for command in commands
+                    }
+                    return results
+                results["commands"] = executor.split_batch(
+                    commands, marker, proc.stdout or b"", proc.stderr or b""
+                )
+                return results
+
+            channels = asyncio.Semaphore(max_channels)
+
+            async def run_command(command: str) -> Any:
+                """Run one command in its own session once a channel is free."""
+                async with channels:
+                    # encoding=None keeps output as bytes; the executor decides
+                    # whether to decode
+                    return await conn.run(command, timeout=timeout, encoding=None)
+
+            completed = await asyncio.gather(
+                *(run_command(command) for command in commands),
+                return_exceptions=True,
+            )
+
+    for command, proc in zip(commands, completed):
+        if isinstance(proc, Exception):
+            results["commands"][command] = executor.command_error(command, str(proc))
+            continue
+        exit_code = proc.exit_status if proc.exit_status is not None else -1
+        try:
+            results["commands"][command] = executor.command_result(
+                command, proc.stdout or b"", proc.stderr or b"", exit_code
+            )
+        except Exception as e:
+            results["commands"][command] = executor.command_error(command, str(e))
+
+    return results
+
+
+async def async_execute_on_hosts(
+    executor_class: type,
+    hosts: List[str],
+    username: Optional[str] = None,
+    identity_file: Optional[str] = None,
+    debug: bool = False,
+    show_progress: bool = True,
+    total_limit: int = TOTAL_LIMIT,
+    connect_limit: int = CONNECT_LIMIT,
+    max_channels: int = MAX_CHANNELS,
+) -> List[Dict[str, Any]]:
+    """Execute commands on multiple hosts concurrently with asyncio.
+
+    One asyncio.Semaphore bounds the hosts in progress (total_limit,
+    independent of the thread pool's max_workers). A second, smaller one
+    guards only the connect phase, so many hosts can run commands while new
+    handshakes are throttled below sshd's MaxStartups.
+
+    Args:
+        executor_class: Class derived from CommandExecutor to use
+        hosts: List of hostnames to connect to
+        username: SSH username (optional)
+        identity_file: Path to SSH identity file (optional)
+        debug: Enable debug logging
+        show_progress: Show progress messages as hosts complete
+        total_limit: Maximum number of hosts in progress (default: 256)
+        connect_limit: Maximum number of handshakes in progress (default: 8)
+        max_channels: Maximum number of sessions per connection for unbatched
+            executors (default: 8)
+
+    Returns:
+        List of result dictionaries, one per host
+    """
+    semaphore = asyncio.Semaphore(total_limit)
+    connect_semaphore = asyncio.Semaphore(connect_limit)
+    total = len(hosts)
+    completed = 0
+
+    if show_progress:
+        print(
+            f"\n📋 Task Queue: {total} hosts, up to {total_limit} concurrent, "
+            f"{connect_limit} connecting at once"
+        )
+
+    async def execute_on_host(host: str) -> Dict[str, Any]:
+        """Execute on a single host."""
+        nonlocal completed
+        executor = executor_class(host, username, identity_file, debug)
+        try:
+            result = await run_host(
+                executor, semaphore, connect_semaphore, max_channels=max_channels
+            )
+        except Exception as e:
+            result = {"host": host, "success": False, "error": str(e), "commands": {}}
+        completed += 1
+        if show_progress and not debug:
+            status = "✓" if result["success"] else "✗"
+            print(f"  {status} Completed ({completed}/{total}): {host}")
+        elif debug:
+            print(f"Completed execution on {host}")
+        return result
+
+    return list(await asyncio.gather(*(execute_on_host(host) for host in hosts)))
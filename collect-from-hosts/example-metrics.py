@@ -22,88 +22,147 @@ spec.loader.exec_module(collect_module)
 CommandExecutor = collect_module.CommandExecutor
 execute_on_hosts = collect_module.execute_on_hosts
 read_hosts_file = collect_module.read_hosts_file
+TRANSPORTS = collect_module.TRANSPORTS
+ASYNC_HOST_THRESHOLD = collect_module.ASYNC_HOST_THRESHOLD
 
 from typing import List, Dict, Any
 import argparse
+import json
+import math
+
+
+# Single remote invocation that prints every metric as one JSON object.
+# Uses python3 when the host has it, otherwise an awk equivalent.
+METRICS_COMMAND = r"""if command -v python3 >/dev/null 2>&1; then
+python3 - <<'EOF'
+import json, os
+cpu_count = sum(1 for line in open("/proc/cpuinfo") if line.startswith("processor"))
+meminfo = {}
+for line in open("/proc/meminfo"):
+    key, value = line.split(":", 1)
+    meminfo[key] = int(value.split()[0])
+st = os.statvfs("/")
+print(json.dumps({
+    "cpu_count": cpu_count,
+    "mem_total_kb": meminfo["MemTotal"],
+    "mem_available_kb": meminfo.get("MemAvailable", meminfo["MemFree"]),
+    "disk_size_kb": st.f_blocks * st.f_frsize // 1024,
+    "disk_used_kb": (st.f_blocks - st.f_bfree) * st.f_frsize // 1024,
+    "disk_avail_kb": st.f_bavail * st.f_frsize // 1024,
+    "uptime_seconds": float(open("/proc/uptime").read().split()[0]),
+}))
+EOF
+else
+df -Pk / | awk '
+    /^processor/ { cpus++ }
+    $1 == "MemTotal:" { total = $2 }
+    $1 == "MemFree:" { free = $2 }
+    $1 == "MemAvailable:" { avail = $2 }
+    FILENAME == "/proc/uptime" { up = $1 }
+    NF >= 6 && $NF == "/" { dsize = $2; dused = $3; davail = $4 }
+    END {
+        if (avail == "") avail = free
+        printf "{\"cpu_count\": %d, \"mem_total_kb\": %d, \"mem_available_kb\": %d, ", cpus, total, avail
+        printf "\"disk_size_kb\": %d, \"disk_used_kb\": %d, \"disk_avail_kb\": %d, ", dsize, dused, davail
+        printf "\"uptime_seconds\": %s}\n", up
+    }' /proc/cpuinfo /proc/meminfo /proc/uptime -
+fi"""
+
+
+def human_size(kb: int) -> str:
+    """Format a size in KiB the way `df -h` does (rounded up, e.g. 8.0G, 193G)."""
+    size = float(kb)
+    unit = "K"
+    for next_unit in "MGTPE":
+        if size < 1024:
+            break
+        size /= 1024
+        unit = next_unit
+    if size < 10:
+        return f"{math.ceil(size * 10) / 10:.1f}{unit}"
+    return f"{math.ceil(size)}{unit}"
+
+
+def format_uptime(seconds: float) -> str:
+    """Format uptime seconds like `uptime` does (e.g. 29 days, 3:21)."""
+    minutes = int(seconds) // 60
+    days, minutes = divmod(minutes, 24 * 60)
+    hours, minutes = divmod(minutes, 60)
+    clock = f"{hours}:{minutes:02d}" if hours else f"{minutes} min"
+    if days:
+        return f"{days} day{'s' if days != 1 else ''}, {clock}"
+    return clock
 
 
 class SystemMetricsExecutor(CommandExecutor):
     """Collect system metrics including CPU, memory, and disk usage."""
 
+    compress = True
+
+    # json.loads parses the raw bytes directly
+    decode_output = False
+
     def get_commands(self) -> List[str]:
-        """Return commands to collect system metrics."""
-        return [
-            "cat /proc/cpuinfo | grep processor | wc -l",  # CPU count
-            "free -m | grep Mem",  # Memory info
-            "df -h / | tail -1",  # Root disk usage
-            "uptime | awk '{print $3,$4}'",  # Uptime
-        ]
+        """Return the single command that collects all system metrics."""
+        return [METRICS_COMMAND]
 
     def parse_response(
-        self, command: str, stdout: str, stderr: str, exit_code: int
+        self, command: str, stdout: bytes, stderr: bytes, exit_code: int
     ) -> Dict[str, Any]:
-        """Parse command output into structured metrics."""
+        """Parse the JSON metrics blob into structured metrics."""
 
         if exit_code != 0:
-            return {"error": stderr or "Command failed", "success": False}
-
-        output = stdout.strip()
-
-        # Parse CPU count
-        if "cpuinfo" in command:
-            try:
-                cpu_count = int(output)
-                return {"metric": "cpu_count", "value": cpu_count, "unit": "cores"}
-            except ValueError:
-                return {"error": "Failed to parse CPU count", "success": False}
-
-        # Parse memory info
-        elif "free -m" in command:
-            try:
-                parts = output.split()
-                # Format: Mem: total used free shared buff/cache available
-                total_mb = int(parts[1])
-                used_mb = int(parts[2])
-                available_mb = int(parts[-1])
-                used_percent = (used_mb / total_mb * 100) if total_mb > 0 else 0
-
-                return {
-                    "metric": "memory",
-                    "total_mb": total_mb,
-                    "used_mb": used_mb,
-                    "available_mb": available_mb,
-                    "used_percent": round(used_percent, 1),
-                    "unit": "MB",
-                }
-            except (ValueError, IndexError) as e:
-                return {"error": f"Failed to parse memory: {e}", "success": False}
-
-        # Parse disk usage
-        elif "df -h" in command:
-            try:
-                parts = output.split()
-                # Format: filesystem size used avail use% mounted
-                size = parts[1]
-                used = parts[2]
-                avail = parts[3]
-                use_percent = parts[4].rstrip("%")
-
-                return {
-                    "metric": "disk_usage",
-                    "size": size,
-                    "used": used,
-                    "available": avail,
-                    "used_percent": int(use_percent),
-                }
-            except (ValueError, IndexError) as e:
-                return {"error": f"Failed to parse disk usage: {e}", "success": False}
-
-        # Parse uptime
-        elif "uptime" in command:
-            return {"metric": "uptime", "value": output}
-
-        # Default response
-        return {"output": output}
+            error = stderr.decode("utf-8", "replace").strip()
+            return {"error": error or "Command failed", "success": False}
+
+        try:
+            raw = json.loads(stdout)
+            metrics = {
+                "cpu_count": self._parse_cpu(raw),
+                "memory": self._parse_memory(raw),
+                "disk_usage": self._parse_disk(raw),
+                "uptime": self._parse_uptime(raw),
+            }
+        except (KeyError, TypeError, ValueError) as e:
+            return {"error": f"Failed to parse metrics: {e}", "success": False}
+
+        return {"metrics": metrics}
+
+    def _parse_cpu(self, raw: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse the CPU core count."""
+        return {"metric": "cpu_count", "value": int(raw["cpu_count"]), "unit": "cores"}
+
+    def _parse_memory(self, raw: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse memory totals from /proc/meminfo values (KiB)."""
+        total_mb = int(raw["mem_total_kb"]) // 1024
+        available_mb = int(raw["mem_available_kb"]) // 1024
+        used_mb = total_mb - available_mb
+        used_percent = (used_mb / total_mb * 100) if total_mb > 0 else 0
+        return {
+            "metric": "memory",
+            "total_mb": total_mb,
+            "used_mb": used_mb,
+            "available_mb": available_mb,
+            "used_percent": round(used_percent, 1),
+            "unit": "MB",
+        }
+
+    def _parse_disk(self, raw: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse root filesystem usage (KiB) into df -h style sizes."""
+        used_kb = int(raw["disk_used_kb"])
+        avail_kb = int(raw["disk_avail_kb"])
+        in_use = used_kb + avail_kb
+        return {
+            "metric": "disk_usage",
+            "size": human_size(int(raw["disk_size_kb"])),
+            "used": human_size(used_kb),
+            "available": human_size(avail_kb),
+            "used_percent": math.ceil(used_kb * 100 / in_use) if in_use else 0,
+        }
+
+    def _parse_uptime(self, raw: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse uptime seconds into a readable duration."""
+        return {"metric": "uptime", "value": format_uptime(float(raw["uptime_seconds"]))}
 
 
 def main():
@@ -126,7 +185,7 @@ def main():
         "--workers",
         type=int,
         default=5,
-        help="Maximum number of concurrent SSH connections (task queue size)",
+        help="Maximum number of concurrent SSH connections (task queue size); the asyncssh transport uses its own limits",
     )
     parser.add_argument(
         "-j",
@@ -135,6 +194,12 @@ def main():
         dest="workers",
         help="Alias for --workers (maximum concurrent jobs)",
     )
+    parser.add_argument(
+        "--transport",
+        choices=("auto",) + TRANSPORTS,
+        default="auto",
+        help=f"SSH transport (auto uses asyncssh above {ASYNC_HOST_THRESHOLD} hosts when installed, asyncssh requires the asyncssh package, mux uses the ssh binary with ControlMaster, libssh2 requires ssh2-python)",
+    )
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
     args = parser.parse_args()
@@ -145,9 +210,7 @@ def main():
     # Read hosts
     try:
         hosts = read_hosts_file(args.hosts_file)
-        print(
-            f"📁 Collecting metrics from {len(hosts)} hosts with {args.workers} concurrent workers...\n"
-        )
+        print(f"📁 Collecting metrics from {len(hosts)} hosts...\n")
     except Exception as e:
         print(f"Error reading hosts file: {e}")
         return 1
@@ -161,60 +224,66 @@ def main():
         max_workers=args.workers,
         debug=args.debug,
         show_progress=not args.debug,
+        transport=args.transport,
     )
 
-    # Display results in a nice format
-    print("=" * 80)
-    print("SYSTEM METRICS")
-    print("=" * 80)
+    # Display results in a nice format, written in one go
+    lines: List[str] = ["=" * 80, "SYSTEM METRICS", "=" * 80]
 
     for result in results:
         host = result["host"]
         success = result["success"]
 
-        print(f"\n📊 {host}")
-        print("-" * 80)
+        lines.append(f"\n📊 {host}")
+        lines.append("-" * 80)
 
         if not success:
-            print(f"  ❌ Error: {result.get('error', 'Unknown error')}")
+            lines.append(f"  ❌ Error: {result.get('error', 'Unknown error')}")
             continue
 
         # Extract metrics from commands
         metrics = {}
         for cmd, cmd_result in result["commands"].items():
             if cmd_result["success"]:
-                parsed = cmd_result["parsed_data"]
-                metric_name = parsed.get("metric")
-                if metric_name:
-                    metrics[metric_name] = parsed
+                metrics.update(cmd_result["parsed_data"].get("metrics", {}))
+            else:
+                error = (
+                    cmd_result.get("error")
+                    or cmd_result.get("parsed_data", {}).get("error")
+                    or "Unknown error"
+                )
+                lines.append(f"  ❌ Error: {error}")
 
         # Display metrics
-        if "cpu_count" in metrics:
-            print(
-                f"  🖥️  CPUs: {metrics['cpu_count']['value']} {metrics['cpu_count']['unit']}"
-            )
+        cpu = metrics.get("cpu_count")
+        if cpu:
+            lines.append(f"  🖥️  CPUs: {cpu['value']} {cpu['unit']}")
 
-        if "memory" in metrics:
-            mem = metrics["memory"]
-            print(
+        mem = metrics.get("memory")
+        if mem:
+            lines.append(
                 f"  💾 Memory: {mem['used_mb']}/{mem['total_mb']} MB "
-                + f"({mem['used_percent']}% used, {mem['available_mb']} MB available)"
+                f"({mem['used_percent']}% used, {mem['available_mb']} MB available)"
             )
 
-        if "disk_usage" in metrics:
-            disk = metrics["disk_usage"]
-            print(
+        disk = metrics.get("disk_usage")
+        if disk:
+            lines.append(
                 f"  💿 Disk: {disk['used']}/{disk['size']} "
-                + f"({disk['used_percent']}% used, {disk['available']} available)"
+                f"({disk['used_percent']}% used, {disk['available']} available)"
             )
 
-        if "uptime" in metrics:
-            print(f"  ⏱️  Uptime: {metrics['uptime']['value']}")
+        uptime = metrics.get("uptime")
+        if uptime:
+            lines.append(f"  ⏱️  Uptime: {uptime['value']}")
 
     # Summary
     successful = sum(1 for r in results if r["success"])
-    print(f"\n{'='*80}")
-    print(f"✅ Successfully collected metrics from {successful}/{len(results)} hosts")
+    lines.append(f"\n{'='*80}")
+    lines.append(
+        f"✅ Successfully collected metrics from {successful}/{len(results)} hosts"
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return 0 if successful == len(results) else 1
 
@@ -0,0 +1,111 @@
+"""Tests for batched command execution."""
+
+import importlib.util
+import os
+import subprocess
+
+SCRIPT = os.path.join(os.path.dirname(__file__), "..", "collect-from-hosts.py")
+
+# The script name has dashes, so it is loaded from its path
+spec = importlib.util.spec_from_file_location("collect_from_hosts", SCRIPT)
+collect = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(collect)
+
+
+class LocalShellConnection:
+    """Connection stand-in that runs the command in a local sh."""
+
+    concurrent_commands = False
+
+    def __init__(self):
+        self.scripts = []
+
+    def execute_command_bytes(self, command, timeout=30):
+        self.scripts.append(command)
+        proc = subprocess.run(["sh", "-c", command], capture_output=True)
+        return proc.stdout, proc.stderr, proc.returncode
+
+
+class EchoExecutor(collect.CommandExecutor):
+    """Returns each command's raw stdout and stderr as its parsed data."""
+
+    commands = []
+
+    def get_commands(self):
+        return self.commands
+
+    def parse_response(self, command, stdout, stderr, exit_code):
+        return {"stdout": stdout, "stderr": stderr}
+
+
+def run_batch(commands):
+    executor = EchoExecutor("localhost")
+    executor.commands = commands
+    executor.connection = LocalShellConnection()
+    results = executor.execute_batched()
+    assert len(executor.connection.scripts) == 1
+    return results
+
+
+def test_batch_splits_per_command_output():
+    results = run_batch(["echo one", "printf two", "echo three >&2"])
+    assert results["echo one"]["parsed_data"] == {"stdout": "one\n", "stderr": ""}
+    assert results["printf two"]["parsed_data"] == {"stdout": "two", "stderr": ""}
+    assert results["echo three >&2"]["parsed_data"] == {
+        "stdout": "",
+        "stderr": "three\n",
+    }
+
+
+def test_batch_output_containing_the_separator():
+    commands = [
+        f"echo {collect.CMD_SEP}",
+        f"printf 'a\\n{collect.CMD_SEP}0__\\n'; printf 'x\\n{collect.CMD_SEP}\\n' >&2",
+        "echo last; echo err >&2",
+    ]
+    results = run_batch(commands)
+    assert results[commands[0]]["parsed_data"]["stdout"] == f"{collect.CMD_SEP}\n"
+    assert results[commands[1]]["parsed_data"] == {
+        "stdout": f"a\n{collect.CMD_SEP}0__\n",
+        "stderr": f"x\n{collect.CMD_SEP}\n",
+    }
+    assert results[commands[2]]["parsed_data"] == {
+        "stdout": "last\n",
+        "stderr": "err\n",
+    }
+
+
+def test_batch_command_failing_mid_batch():
+    results = run_batch(["echo before", "echo oops >&2; false", "echo after"])
+    assert results["echo oops >&2; false"] == {
+        "exit_code": 1,
+        "parsed_data": {"stdout": "", "stderr": "oops\n"},
+        "success": False,
+    }
+    # Later commands still run and keep their own output
+    assert results["echo after"]["success"]
+    assert results["echo after"]["parsed_data"]["stdout"] == "after\n"
+    assert results["echo before"]["exit_code"] == 0
+
+
+def test_batch_ended_early():
+    results = run_batch(["echo first", "exit 3", "echo never"])
+    assert results["echo first"]["success"]
+    for command in ("exit 3", "echo never"):
+        assert results[command]["success"] is False
+        assert results[command]["error"] == "Batch ended before command completed"
+
+
+def test_batch_connection_error():
+    class FailingConnection:
+        def execute_command_bytes(self, command, timeout=30):
+            raise OSError("connection reset")
+
+    executor = EchoExecutor("localhost")
+    executor.commands = ["echo a", "echo b"]
+    executor.connection = FailingConnection()
+    results = executor.execute_batched()
+    assert {command: result["error"] for command, result in results.items()} == {
+        "echo a": "connection reset",
+        "echo b": "connection reset",
+    }
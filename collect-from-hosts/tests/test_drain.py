@@ -0,0 +1,66 @@
+"""Tests for draining a paramiko channel."""
+
+import importlib.util
+import os
+import threading
+import time
+
+SCRIPT = os.path.join(os.path.dirname(__file__), "..", "collect-from-hosts.py")
+
+# The script name has dashes, so it is loaded from its path
+spec = importlib.util.spec_from_file_location("collect_from_hosts", SCRIPT)
+collect = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(collect)
+
+
+class LateOutputChannel:
+    """paramiko Channel stand-in whose exit status arrives before its output."""
+
+    def __init__(self, chunks):
+        self.stdout = bytearray()
+        self.stderr = bytearray()
+        self.eof_received = False
+        self.closed = False
+        self._read_fd, self._write_fd = os.pipe()
+        threading.Thread(target=self._send, args=(chunks,), daemon=True).start()
+
+    def _send(self, chunks):
+        for stream, data in chunks:
+            time.sleep(0.02)
+            getattr(self, stream).extend(data)
+            os.write(self._write_fd, b"x")
+        time.sleep(0.02)
+        self.eof_received = True
+        os.write(self._write_fd, b"x")
+
+    def exit_status_ready(self):
+        return True
+
+    def fileno(self):
+        return self._read_fd
+
+    def recv_ready(self):
+        return bool(self.stdout)
+
+    def recv_stderr_ready(self):
+        return bool(self.stderr)
+
+    def recv(self, size):
+        data = bytes(self.stdout[:size])
+        del self.stdout[:size]
+        return data
+
+    def recv_stderr(self, size):
+        data = bytes(self.stderr[:size])
+        del self.stderr[:size]
+        return data
+
+
+def test_drain_reads_until_eof():
+    channel = LateOutputChannel(
+        [("stdout", b"first\n"), ("stderr", b"warning\n"), ("stdout", b"last\n")]
+    )
+    assert collect.SSHConnection._drain(channel, timeout=5) == (
+        b"first\nlast\n",
+        b"warning\n",
+    )
@@ -0,0 +1,51 @@
+"""Tests for the SSH connection pool."""
+
+import importlib.util
+import os
+
+SCRIPT = os.path.join(os.path.dirname(__file__), "..", "collect-from-hosts.py")
+
+# The script name has dashes, so it is loaded from its path
+spec = importlib.util.spec_from_file_location("collect_from_hosts", SCRIPT)
+collect = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(collect)
+
+
+class FakeConnection:
+    """Pooled connection stand-in that tracks whether it is open."""
+
+    created = []
+
+    def __init__(self, host, username, identity_file, debug, compress):
+        self.active = False
+        FakeConnection.created.append(self)
+
+    def connect(self):
+        self.active = True
+
+    def is_active(self):
+        return self.active
+
+    def close(self):
+        self.active = False
+
+
+def test_pool_reuses_and_replaces_connections():
+    FakeConnection.created = []
+    pool = collect.SSHConnectionPool(max_per_key=2, connection_class=FakeConnection)
+    key = ("host", None, None)
+
+    first = pool.borrow(key)
+    pool.release(key, first)
+    assert pool.borrow(key) is first
+
+    # A connection that died while idle is replaced on the next borrow
+    pool.release(key, first)
+    first.active = False
+    second = pool.borrow(key)
+    assert second is not first
+    assert len(FakeConnection.created) == 2
+
+    pool.release(key, second)
+    pool.close_all()
+    assert not second.active
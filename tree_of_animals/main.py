@@ -1,106 +1,250 @@
 #!/usr/bin/env python3
 """
 Tree of Animals Parser
-Reads lines from a file and processes them through a pyparsing parser.
+Reads lines from a file and processes them through a regex-based parser.
 """
 
+import argparse
+import functools
+import logging
+import logging.handlers
+import re
 import sys
 import os
-from pathlib import Path
-from pyparsing import (
-    ParserElement,
-    ParseException,
-    Word,
-    alphas,
-    alphanums,
-    Literal,
-    Optional,
-    Regex,
-    oneOf,
-    Suppress,
-    CaselessLiteral,
-)
+from concurrent.futures import ThreadPoolExecutor
 
 
-# Enable packrat parsing for better performance (optional)
-ParserElement.enablePackrat()
+# Top-level directory for the hierarchy
+TOP_DIR = "top"
 
+# Progress messages, shown with --verbose. They are logged with %-style
+# arguments, so nothing is formatted unless the INFO level is enabled.
+logger = logging.getLogger("tree_of_animals")
+
+# Progress messages buffered before each write to stdout
+LOG_CAPACITY = 1024
+
+
+class BufferedStdoutHandler(logging.handlers.BufferingHandler):
+    """Buffer log records and write them to stdout with one write() per flush."""
+
+    def flush(self):
+        """Write all buffered records to stdout in a single write."""
+        self.acquire()
+        try:
+            if self.buffer:
+                sys.stdout.write(
+                    "".join(self.format(record) + "\n" for record in self.buffer)
+                )
+                self.buffer.clear()
+            sys.stdout.flush()
+        finally:
+            self.release()
+
+
+def setup_logging(verbose=False):
+    """
+    Send the progress messages to stdout through a buffering handler.
+
+    Args:
+        verbose: Show the progress messages (INFO) instead of only warnings
+
+    Returns:
+        The handler, to be flushed once the run is over
+    """
+    handler = BufferedStdoutHandler(LOG_CAPACITY)
+    logger.addHandler(handler)
+    logger.propagate = False
+    logger.setLevel(logging.INFO if verbose else logging.WARNING)
+    return handler
+
+
+# Directories known to exist, so each is only mkdir'd once per run (see
+# reset_run()).
+# Paths are plain strings handled with os/os.path: pathlib adds several
+# Python-level calls to every join, mkdir and symlink.
+_CREATED_DIRS: set[str] = set()
 
-# Top-level directory for the hierarchy
-TOP_DIR = Path("top")
+
+def make_dirs(path):
+    """Create a directory and its parents, unless already done this run."""
+    if not path or path in _CREATED_DIRS:
+        return
+    os.makedirs(path, exist_ok=True)
+    while path and path not in _CREATED_DIRS:
+        _CREATED_DIRS.add(path)
+        path = os.path.dirname(path)
 
 
 def ensure_directory(path):
     """Create directory if it doesn't exist."""
-    path = Path(path)
-    path.mkdir(parents=True, exist_ok=True)
-    print(f"  📁 Ensured directory: {path}")
+    make_dirs(path)
 
 
 def create_file(path, content):
     """Create a file with the given content."""
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
+    make_dirs(os.path.dirname(path))
     with open(path, "w") as f:
         f.write(content + "\n")
-    print(f"  📄 Created file: {path} with content: {content}")
+
+
+# (link, target) pairs already in place, so each symlink is only made once
+# per run
+_CREATED_LINKS: set[tuple[str, str]] = set()
 
 
 def create_symlink(link_path, target_path):
     """Create a symbolic link."""
-    link_path = Path(link_path)
-    target_path = Path(target_path)
+    if (link_path, target_path) in _CREATED_LINKS:
+        return
 
     # Create parent directory for the link
-    link_path.parent.mkdir(parents=True, exist_ok=True)
+    make_dirs(os.path.dirname(link_path))
+
+    # Keep a link left by an earlier run if it already points at the target
+    try:
+        if os.readlink(link_path) == target_path:
+            _CREATED_LINKS.add((link_path, target_path))
+            return
+    except OSError:
+        pass
 
     # Remove existing symlink if it exists
-    if link_path.exists() or link_path.is_symlink():
-        link_path.unlink()
+    try:
+        os.unlink(link_path)
+    except FileNotFoundError:
+        pass
 
     # Create relative symlink
-    link_path.symlink_to(target_path)
-    print(f"  🔗 Created symlink: {link_path} -> {target_path}")
+    os.symlink(target_path, link_path)
+    _CREATED_LINKS.add((link_path, target_path))
+
+
+# Write-ahead plan: the parse actions only record the filesystem changes a
+# line asks for, as ("mkdir", path), ("write", path, content) or
+# ("symlink", link, target); apply_plan() carries them out after parsing.
+_PLAN: list[tuple] = []
+
+# Threads applying each batch of the plan; the filesystem calls release the
+# GIL, so the operations of a batch are in flight at the same time. This pays
+# off on high-latency storage (NFS and the like); on a local disk each call
+# takes microseconds and more threads only add handoff overhead.
+PLAN_WORKERS = 8
+
+
+def apply_plan(plan):
+    """
+    Apply the recorded filesystem changes in batches.
+
+    Each directory is created once, parents before children; each file is
+    written once with its last requested content, files in the same
+    directory back-to-back; symlinks come last, once their targets exist.
+    The operations within a batch are independent and run on a thread
+    pool; each batch finishes before the next starts, and the progress
+    messages are logged in plan order.
+
+    Args:
+        plan: Records appended by the parse actions
+    """
+    directories = {}
+    files = {}
+    links = {}
+    for kind, path, *args in plan:
+        if kind == "mkdir":
+            directories[path] = None
+        elif kind == "write":
+            files[path] = args[0]
+        else:
+            links[path] = args[0]
+
+    # os.makedirs() tolerates a parent being created by another thread
+    directories = sorted(directories, key=lambda path: path.count(os.sep))
+    file_paths = sorted(files, key=os.path.dirname)
+    contents = [files[path] for path in file_paths]
+    with ThreadPoolExecutor(max_workers=PLAN_WORKERS) as pool:
+        # Results arrive in submission order, so each message is logged
+        # once its own operation has finished
+        done = pool.map(ensure_directory, directories)
+        for path, _ in zip(directories, done):
+            logger.info("  📁 Ensured directory: %s", path)
+        done = pool.map(create_file, file_paths, contents)
+        for path, content, _ in zip(file_paths, contents, done):
+            logger.info("  📄 Created file: %s with content: %s", path, content)
+        done = pool.map(create_symlink, links, links.values())
+        for (link_path, target_path), _ in zip(links.items(), done):
+            logger.info("  🔗 Created symlink: %s -> %s", link_path, target_path)
+
+
+# Entity names recur across rules and lines, so their lowercased (interned)
+# forms and the paths built from them are computed once and reused
+@functools.lru_cache(maxsize=1024)
+def lower_name(name):
+    """Return name lowercased and interned."""
+    return sys.intern(name.lower())
+
+
+@functools.lru_cache(maxsize=1024)
+def entity_path(*names):
+    """Return TOP_DIR joined with names."""
+    return os.path.join(TOP_DIR, *names)
+
+
+@functools.lru_cache(maxsize=1024)
+def link_target(prey):
+    """Return the relative path from top/<A>/eats/<B> to top/<B>."""
+    return os.path.join("../..", prey)
+
+
+def reset_run():
+    """
+    Forget what an earlier parse_file() call created or planned.
 
+    The output tree may have been removed since, or TOP_DIR changed, so
+    directories, links and paths are checked or built again.
+    """
+    _CREATED_DIRS.clear()
+    _CREATED_LINKS.clear()
+    _PLAN.clear()
+    entity_path.cache_clear()
+    link_target.cache_clear()
 
-# Parse Actions
-def action_there_exists(tokens):
+
+# Parse Actions: each takes the rule's fields positionally, in line order
+def action_there_exists(entity):
     """
     Rule 1: "There exists <A>"
     Creates directory: top/<A>
     """
-    entity = tokens["entity"].lower()
-    print(f"Rule 1: There exists {entity}")
-    ensure_directory(TOP_DIR / entity)
+    entity = lower_name(entity)
+    logger.info("Rule 1: There exists %s", entity)
+    _PLAN.append(("mkdir", entity_path(entity)))
     return {"rule": "exists", "entity": entity}
 
 
-def action_are(tokens):
+def action_are(child, parent):
     """
     Rule 2: "<A> are <B>"
     Creates directory: top/<B>/<A>
     """
-    child = tokens["child"].lower()
-    parent = tokens["parent"].lower()
-    print(f"Rule 2: {child} are {parent}")
-    ensure_directory(TOP_DIR / parent / child)
+    child = lower_name(child)
+    parent = lower_name(parent)
+    logger.info("Rule 2: %s are %s", child, parent)
+    _PLAN.append(("mkdir", entity_path(parent, child)))
     return {"rule": "are", "child": child, "parent": parent}
 
 
-def action_have(tokens):
+def action_have(entity, attribute, key, value):
     """
     Rule 3: "<A> have <B>(<C> : <D>)"
     Creates file: top/<A>/<B> with contents "<C>: <D>"
     """
-    entity = tokens["entity"].lower()
-    attribute = tokens["attribute"].lower()
-    key = tokens["key"]
-    value = tokens["value"]
-    print(f"Rule 3: {entity} have {attribute}({key}: {value})")
+    entity = lower_name(entity)
+    attribute = lower_name(attribute)
+    logger.info("Rule 3: %s have %s(%s: %s)", entity, attribute, key, value)
 
-    file_path = TOP_DIR / entity / attribute
+    file_path = entity_path(entity, attribute)
     content = f"{key}: {value}"
-    create_file(file_path, content)
+    _PLAN.append(("write", file_path, content))
     return {
         "rule": "have",
         "entity": entity,
@@ -110,93 +254,211 @@ def action_have(tokens):
     }
 
 
-def action_eat(tokens):
+def action_eat(predator, prey):
     """
     Rule 4: "<A> eats <B>"
     Creates symlink: top/<A>/eats/<B> -> top/<B>
     """
-    predator = tokens["predator"].lower()
-    prey = tokens["prey"].lower()
-    print(f"Rule 4: {predator} eat {prey}")
-
-    link_path = TOP_DIR / predator / "eats" / prey
-    target_path = (
-        Path("../../") / prey
-    )  # Relative path from top/<A>/eats/<B> to top/<B>
-    create_symlink(link_path, target_path)
+    predator = lower_name(predator)
+    prey = lower_name(prey)
+    logger.info("Rule 4: %s eat %s", predator, prey)
+
+    link_path = entity_path(predator, "eats", prey)
+    _PLAN.append(("symlink", link_path, link_target(prey)))
     return {"rule": "eat", "predator": predator, "prey": prey}
 
 
+# Entity/attribute names: a letter followed by letters, numbers and underscores.
+# The closing \b stops a match from ending inside a longer word, so (as with a
+# tokenizer) "Cowsare animals" does not split into "Cows" + "are".
+NAME = r"[A-Za-z][A-Za-z0-9_]*\b"
+
+# What str.strip() removes around a line: every str.isspace() character except
+# the newline that ends the line
+BLANK = (
+    r"\t\x0b\x0c\r\x1c-\x1f \x85\xa0"
+    r"\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+
+# Whitespace between the tokens of a line (ASCII whitespace, newline excluded)
+SPACE = r"[^\S\n]*"
+
+
 def define_grammar():
     """
-    Define the pyparsing grammar for 4 rules.
+    Define the grammar for the 4 rules as one precompiled regex.
+
+    The pattern matches one whole line at a time (re.MULTILINE), so a
+    single finditer() over the file walks every line in C. Each line is
+    one of the rules, a comment, blank, or an error; surrounding
+    whitespace is skipped as str.strip() would.
+
+    Each rule is an alternative wrapped in a named group, so the match both
+    checks the line and tells which rule it is (match.lastgroup), or
+    "error" for a line that fits none of them; blank and comment lines
+    leave lastgroup at None. Rules 2-4 all start with a name, which is
+    matched once and then followed by one keyword branch per rule, instead
+    of each alternative scanning the name again before failing on its
+    keyword. A line can only fit one rule, so the order of the branches
+    does not change the result. Keywords are case-insensitive and
+    whitespace between tokens is optional, as it was with the pyparsing
+    grammar.
     """
-    # Common elements - entity/attribute names can include letters, numbers, and underscores
-    entity_name = Word(alphas, alphas + alphanums + "_")
-
-    # Rule 1: "There exists <A>"
-    rule1 = (
-        CaselessLiteral("There") + CaselessLiteral("exists") + entity_name("entity")
-    ).setParseAction(action_there_exists)
-
-    # Rule 2: "<A> are <B>"
-    rule2 = (
-        entity_name("child") + CaselessLiteral("are") + entity_name("parent")
-    ).setParseAction(action_are)
-
-    # Rule 3: "<A> have <B>(<C> : <D>)" or "<A> have <B>(<C>:<D>)" or "<A> have <B>(<C>=<D>)"
-    # Key-value pair with flexible separators (: or = with optional spaces)
-    key = Word(alphas, alphas + alphanums + "_")("key")
-    value = Word(alphanums + "_")("value")
-    separator = (
-        Suppress(Optional(" "))
-        + (Literal(":") | Literal("="))
-        + Suppress(Optional(" "))
+    return re.compile(
+        rf"""
+        ^ [{BLANK}]* (?:
+            # Rule 1: "There exists <A>"
+            (?P<rule1> there {SPACE} exists {SPACE} (?P<rule1_entity>{NAME}) )
+          | (?P<subject>{NAME}) {SPACE} (?:
+                # Rule 2: "<A> are <B>"
+                (?P<rule2> are {SPACE} (?P<rule2_parent>{NAME}) )
+                # Rule 3: "<A> have <B>(<C> : <D>)", "<A> have <B>(<C>:<D>)"
+                # or "<A> have <B>(<C>=<D>)"
+              | (?P<rule3>
+                    have {SPACE} (?P<rule3_attribute>{NAME})
+                    {SPACE} \( {SPACE} (?P<rule3_key>{NAME}) {SPACE} [:=] {SPACE}
+                    (?P<rule3_value>[A-Za-z0-9_]+) {SPACE} \)
+                )
+                # Rule 4: "<A> eats <B>" or "<A> eat <B>"; a following "s"
+                # always belongs to the keyword
+              | (?P<rule4> eat(?:s|(?!s)) {SPACE} (?P<rule4_prey>{NAME}) )
+            )
+            # Comment
+          | \# .*
+            # Anything else is reported, without the surrounding whitespace
+          | (?P<error> [^{BLANK}\n] .*? )
+        )? [{BLANK}]* $
+        """,
+        re.ASCII | re.IGNORECASE | re.MULTILINE | re.VERBOSE,
     )
 
-    rule3 = (
-        entity_name("entity")
-        + CaselessLiteral("have")
-        + entity_name("attribute")
-        + Suppress("(")
-        + key
-        + separator
-        + value
-        + Suppress(")")
-    ).setParseAction(action_have)
-
-    # Rule 4: "<A> eats <B>" or "<A> eat <B>"
-    rule4 = (
-        entity_name("predator")
-        + (CaselessLiteral("eats") | CaselessLiteral("eat"))
-        + entity_name("prey")
-    ).setParseAction(action_eat)
 
-    # Combine all rules with | (or)
-    parser = rule1 | rule2 | rule3 | rule4
+# Compiled once at import and shared by every parse_file() call
+_PARSER = define_grammar()
+
+# The rules again as token sequences, only used to explain an error line:
+# (what the token is called in the message, pattern). Keep in step with
+# define_grammar().
+_TOKEN_FLAGS = re.ASCII | re.IGNORECASE
+_NAME_TOKEN = ("name", re.compile(NAME, _TOKEN_FLAGS))
+_END_TOKEN = ("end of line", re.compile(rf"[{BLANK}]*$"))
+_RULE_TOKENS = [
+    [
+        ("'there'", re.compile(r"there", _TOKEN_FLAGS)),
+        ("'exists'", re.compile(r"exists", _TOKEN_FLAGS)),
+        _NAME_TOKEN,
+        _END_TOKEN,
+    ],
+    [_NAME_TOKEN, ("'are'", re.compile(r"are", _TOKEN_FLAGS)), _NAME_TOKEN, _END_TOKEN],
+    [
+        _NAME_TOKEN,
+        ("'have'", re.compile(r"have", _TOKEN_FLAGS)),
+        _NAME_TOKEN,
+        ("'('", re.compile(r"\(")),
+        _NAME_TOKEN,
+        ("':' or '='", re.compile(r"[:=]")),
+        ("value", re.compile(r"[A-Za-z0-9_]+")),
+        ("')'", re.compile(r"\)")),
+        _END_TOKEN,
+    ],
+    [
+        _NAME_TOKEN,
+        ("'eats'", re.compile(r"eat(?:s|(?!s))", _TOKEN_FLAGS)),
+        _NAME_TOKEN,
+        _END_TOKEN,
+    ],
+]
+_SPACE_RE = re.compile(SPACE, re.ASCII)
+_OFFENDING_RE = re.compile(r"\S+|\s")
+
+
+def locate_error(text, start, end):
+    """
+    Find where an error line stops fitting the rules.
 
-    return parser
+    Every rule is followed token by token as far as it goes; the furthest
+    point any of them reaches is where the line goes wrong, as pyparsing
+    reported it.
 
+    Args:
+        text: Text holding the line
+        start: Offset of the line's first non-blank character
+        end: Offset just past its last non-blank character
 
-def process_line(parser, line_number, line):
+    Returns:
+        Offset of the failing point and the tokens expected there
+    """
+    furthest = start
+    expected = []
+    for tokens in _RULE_TOKENS:
+        pos = start
+        for name, token in tokens:
+            found = token.match(text, pos, end)
+            if found is None:
+                break
+            pos = _SPACE_RE.match(text, found.end(), end).end()
+        else:
+            continue
+        if pos > furthest:
+            furthest, expected = pos, [name]
+        elif pos == furthest and name not in expected:
+            expected.append(name)
+    return furthest, expected
+
+
+def process_match(found):
     """
-    Process a single line through the parser.
+    Run the action of the rule a line matched.
 
     Args:
-        parser: The pyparsing parser
-        line_number: Line number for error reporting
-        line: The line content to parse
+        found: Match from define_grammar() for a line that fits a rule
 
     Returns:
-        Parsed result or None if parsing fails
+        Parsed result
     """
-    try:
-        result = parser.parseString(line, parseAll=True)
-        return result
-    except ParseException as pe:
-        print(f"Parse error on line {line_number}: {pe}", file=sys.stderr)
-        print(f"  Line content: {line}", file=sys.stderr)
-        return None
+    # lastgroup names the rule that matched; rules 2-4 share the leading
+    # "subject" group, the other fields are captured inside the rule's group
+    match found.lastgroup:
+        case "rule1":
+            return action_there_exists(found["rule1_entity"])
+        case "rule2":
+            return action_are(*found.group("subject", "rule2_parent"))
+        case "rule3":
+            return action_have(
+                *found.group(
+                    "subject", "rule3_attribute", "rule3_key", "rule3_value"
+                )
+            )
+        case "rule4":
+            return action_eat(*found.group("subject", "rule4_prey"))
+
+
+def print_error(text, found, line_number):
+    """
+    Report a line that fits none of the rules, with the failing column.
+
+    Args:
+        text: Text holding the line
+        found: Match from define_grammar() for the line, with lastgroup "error"
+        line_number: Line number of the match
+    """
+    start, end = found.span("error")
+    position, expected = locate_error(text, start, end)
+    column = position - text.rfind("\n", 0, start)
+    # The word at that point, or the one blank character the rules do not
+    # accept there
+    offending = _OFFENDING_RE.match(text, position, end)
+    found_text = repr(offending[0]) if offending else "end of line"
+    if len(expected) > 1:
+        expected_text = ", ".join(expected[:-1]) + " or " + expected[-1]
+    else:
+        expected_text = expected[0]
+    print(
+        f"Parse error on line {line_number}, column {column}: "
+        f"expected {expected_text}, found {found_text}",
+        file=sys.stderr,
+    )
+    print(f"  Line content: {found['error']}", file=sys.stderr)
 
 
 def parse_file(filename):
@@ -209,29 +471,32 @@ def parse_file(filename):
     Returns:
         List of parsed results
     """
-    parser = define_grammar()
-
-    if parser is None:
-        print("Error: Parser grammar not defined yet!", file=sys.stderr)
-        return []
-
-    # Attach parse actions
-    # parser.setParseAction(parse_action_placeholder)
-
     results = []
+    reset_run()
 
     try:
         with open(filename, "r") as f:
-            for line_number, line in enumerate(f, start=1):
-                line = line.strip()
-
-                # Skip empty lines and comments
-                if not line or line.startswith("#"):
-                    continue
-
-                result = process_line(parser, line_number, line)
-                if result is not None:
-                    results.append(result)
+            text = f.read()
+
+        # Line numbers are only needed for errors, so they are counted from
+        # the previous error instead of for every line
+        line_number = 1
+        counted = 0
+        for found in _PARSER.finditer(text):
+            rule = found.lastgroup
+            if rule is None:
+                # Empty line or comment
+                continue
+            if rule == "error":
+                line_number += text.count("\n", counted, found.start())
+                counted = found.start()
+                print_error(text, found, line_number)
+                continue
+            results.append(process_match(found))
+
+        # Carry out what the parsed lines asked for
+        apply_plan(_PLAN)
+        _PLAN.clear()
 
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found!", file=sys.stderr)
@@ -245,20 +510,34 @@ def parse_file(filename):
 
 def main():
     """Main entry point."""
-    if len(sys.argv) != 2:
-        print(f"Usage: {sys.argv[0]} <input_file>", file=sys.stderr)
-        sys.exit(1)
-
-    input_file = sys.argv[1]
-
-    print(f"Parsing file: {input_file}")
-    results = parse_file(input_file)
-
-    print(f"\nSuccessfully parsed {len(results)} lines")
+    parser = argparse.ArgumentParser(
+        description="Build the top/ tree described by an animals input file",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("input_file", help="File with one rule per line")
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Show a progress message for every rule and filesystem change",
+    )
+    args = parser.parse_args()
 
-    # TODO: Process results as needed
-    for i, result in enumerate(results, start=1):
-        print(f"Result {i}: {result}")
+    handler = setup_logging(args.verbose)
+    try:
+        logger.info("Parsing file: %s", args.input_file)
+        results = parse_file(args.input_file)
+
+        # Progress so far goes out before the summary, after a blank line
+        logger.info("")
+        handler.flush()
+        print(f"Successfully parsed {len(results)} lines")
+
+        for i, result in enumerate(results, start=1):
+            logger.info("Result %d: %s", i, result)
+    finally:
+        # Also on sys.exit() or an error, so no progress output is lost
+        handler.flush()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,47 @@
+"""Fixtures that run parse_file() in a scratch directory."""
+
+import importlib.util
+import os
+
+import pytest
+
+SCRIPT = os.path.join(os.path.dirname(__file__), "..", "main.py")
+
+spec = importlib.util.spec_from_file_location("tree_of_animals_main", SCRIPT)
+tree = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(tree)
+
+
+@pytest.fixture
+def run(tmp_path, monkeypatch):
+    """Parse the given text in a fresh directory and return the results."""
+    monkeypatch.chdir(tmp_path)
+
+    def parse(text):
+        with open("input.data", "w", newline="") as f:
+            f.write(text)
+        return tree.parse_file("input.data")
+
+    return parse
+
+
+@pytest.fixture
+def tree_contents():
+    """Return a function listing every path under top/ with its content."""
+
+    def list_tree():
+        """Return every path under top/ with its file content or link target."""
+        found = {}
+        for root, dirs, files in os.walk("top"):
+            for name in dirs + files:
+                path = os.path.join(root, name)
+                if os.path.islink(path):
+                    found[path] = "-> " + os.readlink(path)
+                elif os.path.isfile(path):
+                    with open(path) as f:
+                        found[path] = f.read()
+                else:
+                    found[path] = None
+        return found
+
+    return list_tree
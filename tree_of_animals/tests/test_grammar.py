@@ -0,0 +1,128 @@
+"""Tests for the rule grammar and the tree it builds."""
+
+import pytest
+
+# Edge-case lines and the result each parses to (None: a parse error), as the
+# pyparsing grammar handled them. Outer Unicode whitespace is stripped like
+# str.strip() does; between tokens only ASCII whitespace is accepted.
+EDGE_CASES = [
+    ("There exists animals", {"rule": "exists", "entity": "animals"}),
+    ("  Cows are animals  ", {"rule": "are", "child": "cows", "parent": "animals"}),
+    (
+        "Cows have legs(number: 4)",
+        {
+            "rule": "have",
+            "entity": "cows",
+            "attribute": "legs",
+            "key": "number",
+            "value": "4",
+        },
+    ),
+    (
+        "Cows have legs ( number : 4 )",
+        {
+            "rule": "have",
+            "entity": "cows",
+            "attribute": "legs",
+            "key": "number",
+            "value": "4",
+        },
+    ),
+    (
+        "Cows have legs(number=4)",
+        {
+            "rule": "have",
+            "entity": "cows",
+            "attribute": "legs",
+            "key": "number",
+            "value": "4",
+        },
+    ),
+    ("Cowsare animals", None),
+    ("Cows areanimals", {"rule": "are", "child": "cows", "parent": "animals"}),
+    ("THERE EXISTS Fish", {"rule": "exists", "entity": "fish"}),
+    ("Thereexists fish", {"rule": "exists", "entity": "fish"}),
+    ("Cats eats", None),
+    ("Cats eatsy", {"rule": "eat", "predator": "cats", "prey": "y"}),
+    ("Cats eat Birds extra", None),
+    ("Cats eatBirds", {"rule": "eat", "predator": "cats", "prey": "birds"}),
+    ("There exists 9lives", None),
+    ("Cats have tail(9key: 1)", None),
+    ("Cats have tail(key: )", None),
+    (
+        "Cats have tail(key: val_1)",
+        {
+            "rule": "have",
+            "entity": "cats",
+            "attribute": "tail",
+            "key": "key",
+            "value": "val_1",
+        },
+    ),
+    ("There are animals", {"rule": "are", "child": "there", "parent": "animals"}),
+    ("Dogs are are", {"rule": "are", "child": "dogs", "parent": "are"}),
+    ("Birds EAT worms", {"rule": "eat", "predator": "birds", "prey": "worms"}),
+    ("Birds have wings(number:2", None),
+    ("café are animals", None),
+    ("Cats\tare\tanimals", {"rule": "are", "child": "cats", "parent": "animals"}),
+    ("Lions\xa0eat Zebra", None),
+    (
+        "\u2003Lions eat Zebra\u2003",
+        {"rule": "eat", "predator": "lions", "prey": "zebra"},
+    ),
+    ("Lions eat Zebra\r", {"rule": "eat", "predator": "lions", "prey": "zebra"}),
+]
+
+
+@pytest.mark.parametrize("line, expected", EDGE_CASES)
+def test_edge_case_line(run, line, expected):
+    assert run(line + "\n") == ([expected] if expected else [])
+
+
+@pytest.mark.parametrize("line", ["", "   ", "# comment", "   # indented comment"])
+def test_blank_and_comment_lines_are_skipped(run, capsys, line):
+    assert run(line + "\n") == []
+    assert capsys.readouterr().err == ""
+
+
+def test_last_line_without_newline(run):
+    assert run("\nThere exists fish") == [{"rule": "exists", "entity": "fish"}]
+
+
+def test_error_reports_line_and_column(run, capsys):
+    run("There exists animals\n\n  Cows fly\n")
+    assert capsys.readouterr().err == (
+        "Parse error on line 3, column 8: expected 'are', 'have' or 'eats', "
+        "found 'fly'\n"
+        "  Line content: Cows fly\n"
+    )
+
+
+EDGE_TREE = {
+    "top/animals": None,
+    "top/animals/cats": None,
+    "top/animals/cows": None,
+    "top/animals/there": None,
+    "top/are": None,
+    "top/are/dogs": None,
+    "top/birds": None,
+    "top/birds/eats": None,
+    "top/birds/eats/worms": "-> ../../worms",
+    "top/cats": None,
+    "top/cats/eats": None,
+    "top/cats/eats/birds": "-> ../../birds",
+    "top/cats/eats/y": "-> ../../y",
+    "top/cats/tail": "key: val_1\n",
+    "top/cows": None,
+    "top/cows/legs": "number: 4\n",
+    "top/fish": None,
+    "top/lions": None,
+    "top/lions/eats": None,
+    "top/lions/eats/zebra": "-> ../../zebra",
+}
+
+
+def test_tree_built_from_edge_cases(run, tree_contents):
+    results = run("".join(line + "\n" for line, _ in EDGE_CASES))
+    assert results == [expected for _, expected in EDGE_CASES if expected]
+    assert tree_contents() == EDGE_TREE
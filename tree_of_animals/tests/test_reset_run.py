@@ -0,0 +1,30 @@
+"""Tests for rebuilding the tree on a later parse_file() run."""
+
+import os
+
+TEXT = (
+    "There exists animals\n"
+    "Cows are animals\n"
+    "Cows have legs(number: 4)\n"
+    "Cats are animals\n"
+    "Cats eat Cows\n"
+)
+
+
+def test_second_run_rebuilds_removed_tree(run, tree_contents):
+    run(TEXT)
+    first = tree_contents()
+    for root, dirs, files in os.walk("top", topdown=False):
+        for name in files:
+            os.unlink(os.path.join(root, name))
+        for name in dirs:
+            path = os.path.join(root, name)
+            if os.path.islink(path):
+                os.unlink(path)
+            else:
+                os.rmdir(path)
+    os.rmdir("top")
+
+    run(TEXT)
+    assert tree_contents() == first
+    assert first["top/cats/eats/cows"] == "-> ../../cows"
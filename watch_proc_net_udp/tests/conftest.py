@@ -0,0 +1,22 @@
+"""Captured /proc/net/udp content shared by the parser and stream tests."""
+
+import pytest
+
+# Captured /proc/net/udp: a bound socket with queued data and a connected one.
+# The last row is the second one with uid and drops changed (widths kept).
+PROC_NET_UDP = (
+    b"   sl  local_address rem_address   st tx_queue rx_queue tr tm->when "
+    b"retrnsmt   uid  timeout inode ref pointer drops            \n"
+    b" 2790: 0100007F:14E9 00000000:0000 07 00000000:00000680 00:00000000 "
+    b"00000000     0        0 298995 2 000000004dd418bd 0        \n"
+    b" 3197: 0100007F:8680 0100007F:14E9 01 00000000:00000000 00:00000000 "
+    b"00000000     0        0 298996 2 0000000015a183f4 0        \n"
+    b" 3198: 0100007F:8681 0100007F:14E9 01 000001A0:00000000 00:00000000 "
+    b"00000000  1000        0 298999 2 0000000015a183f4 12       \n"
+)
+
+
+@pytest.fixture
+def proc_net_udp():
+    """Return the captured /proc/net/udp content."""
+    return PROC_NET_UDP
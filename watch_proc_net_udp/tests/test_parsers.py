@@ -0,0 +1,53 @@
+"""Tests for the /proc/net/udp parsers."""
+
+import importlib.util
+import os
+
+import pytest
+
+SCRIPT = os.path.join(os.path.dirname(__file__), "..", "watch-proc-net-udp.py")
+
+# The script name has dashes, so it is loaded from its path
+spec = importlib.util.spec_from_file_location("watch_proc_net_udp", SCRIPT)
+watch = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(watch)
+
+# Captured /proc/net/udp6: 32-digit addresses and rows not padded to the
+# header's width, so the column parser does not apply
+PROC_NET_UDP6 = (
+    b"  sl  local_address                         remote_address          "
+    b"              st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout "
+    b"inode ref pointer drops\n"
+    b" 1368: 00000000000000000000000001000000:CF5B "
+    b"00000000000000000000000000000000:0000 07 00000000:00000000 00:00000000 "
+    b"00000000     0        0 298997 2 000000008ab8b1a1 0\n"
+)
+
+def test_parse_content_matches_parse_lines(proc_net_udp):
+    rows = watch.parse_lines(proc_net_udp.decode("ascii"))
+    assert watch.parse_content(proc_net_udp) == rows
+    assert watch.parse_content(memoryview(proc_net_udp)) == rows
+    assert rows == [
+        watch.UdpConnection("2790:", 5353, 0, "07", 0x680, 0, 0, "0", "298995"),
+        watch.UdpConnection("3197:", 34432, 5353, "01", 0, 0, 0, "0", "298996"),
+        watch.UdpConnection(
+            "3198:", 34433, 5353, "01", 0, 0x1A0, 12, "1000", "298999"
+        ),
+    ]
+
+
+@pytest.mark.skipif(watch.np is None, reason="requires NumPy")
+def test_parse_columns_handles_fixed_width_content(proc_net_udp):
+    assert watch.parse_columns(proc_net_udp) is not None
+
+
+def test_udp6_falls_back_to_parse_lines():
+    assert watch.parse_columns(PROC_NET_UDP6) is None
+    assert watch.parse_content(PROC_NET_UDP6) == [
+        watch.UdpConnection("1368:", 53083, 0, "07", 0, 0, 0, "0", "298997")
+    ]
+
+
+def test_header_only(proc_net_udp):
+    header = proc_net_udp.split(b"\n", 1)[0] + b"\n"
+    assert watch.parse_content(header) == []
@@ -0,0 +1,69 @@
+"""Tests for the remote snapshot and delta stream."""
+
+import importlib.util
+import os
+
+SCRIPT = os.path.join(os.path.dirname(__file__), "..", "watch-proc-net-udp.py")
+
+# The script name has dashes, so it is loaded from its path
+spec = importlib.util.spec_from_file_location("watch_proc_net_udp", SCRIPT)
+watch = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(watch)
+
+
+class FakeWatcher(watch.RemoteWatcher):
+    """RemoteWatcher fed from a list of chunks instead of a channel."""
+
+    def __init__(self, chunks):
+        super().__init__("fake")
+        self.chunks = list(chunks)
+        self.connected = True
+
+    def connect(self, console=None):
+        pass
+
+    def _start_stream(self, console=None):
+        pass
+
+    def _drain(self):
+        if self.chunks:
+            self._recv_buf += self.chunks.pop(0)
+        return b""
+
+    def _stream_ended(self):
+        return False
+
+    def _can_restart(self):
+        return False
+
+    def close(self):
+        pass
+
+
+def test_remote_stream_applies_deltas(proc_net_udp):
+    header, first, second, third = proc_net_udp.rstrip(b"\n").split(b"\n")
+    changed = second.replace(b"00000000:00000000", b"00000010:00000000")
+    watcher = FakeWatcher(
+        [
+            # A full snapshot, split mid-block
+            header + b"\n" + first + b"\n",
+            second + b"\n" + third + b"\n" + watch.SNAPSHOT_END,
+            # Changes only: one row updated, one removed
+            changed + b"\n-298999\n" + watch.SNAPSHOT_END,
+        ]
+    )
+
+    assert watcher.read_file(wait=False) is None
+    snapshot = watcher.read_file(wait=False)
+    assert watch.parse_content(snapshot) == watch.parse_content(proc_net_udp)
+    assert watcher.snapshots == 1
+
+    rows = watch.parse_content(watcher.read_file(wait=False))
+    assert [row.inode for row in rows] == ["298995", "298996"]
+    assert rows[1].tx_queue == 0x10
+    assert watcher.snapshots == 2
+
+    # No new block: the same snapshot object, and no new snapshot counted
+    last = watcher.read_file(wait=False)
+    assert watcher.read_file(wait=False) is last
+    assert watcher.snapshots == 2
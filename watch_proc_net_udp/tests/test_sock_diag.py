@@ -0,0 +1,40 @@
+"""Tests for decoding NETLINK_SOCK_DIAG replies."""
+
+import importlib.util
+import os
+import struct
+
+SCRIPT = os.path.join(os.path.dirname(__file__), "..", "watch-proc-net-udp.py")
+
+# The script name has dashes, so it is loaded from its path
+spec = importlib.util.spec_from_file_location("watch_proc_net_udp", SCRIPT)
+watch = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(watch)
+
+# inet_diag_msg with its attributes (SK_MEMINFO among them) as returned by
+# NETLINK_SOCK_DIAG for a socket listening on 127.0.0.1:54907, inode 298945.
+# Captured for TCP, which uses the same message layout as UDP.
+INET_DIAG_MSG = bytes.fromhex(
+    "020a0000d67b00007f0000010000000000000000000000000000000000000000"
+    "0000000000000000000000000800000000000000000000000000000080000000"
+    "00000000c18f0400050008000000000008000f00000000000c00150001000000"
+    "0000000006001600520000002800070000000000000002000000000000400000"
+    "0000000000000000000000000000000000000000"
+)
+
+
+def test_parse_inet_diag_msg():
+    connection = watch._parse_inet_diag_msg(INET_DIAG_MSG, 0, len(INET_DIAG_MSG), 3)
+    assert connection == watch.UdpConnection(
+        "3:", 54907, 0, "0A", 0, 128, 0, "0", "298945"
+    )
+
+
+def test_parse_inet_diag_msg_reads_drops_from_meminfo():
+    # Set the SK_MEMINFO_DROPS word of the captured meminfo attribute
+    attribute = INET_DIAG_MSG.index(struct.pack("=HH", 40, watch.INET_DIAG_SKMEMINFO))
+    offset = attribute + watch.RTATTR.size + 4 * watch.SK_MEMINFO_DROPS
+    buf = bytearray(INET_DIAG_MSG)
+    struct.pack_into("=I", buf, offset, 7)
+    connection = watch._parse_inet_diag_msg(bytes(buf), 0, len(buf), 0)
+    assert connection.drops == 7